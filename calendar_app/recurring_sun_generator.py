@@ -1,6 +1,5 @@
 from ics import Calendar, Event, DisplayAlarm
-from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
+from datetime import datetime, date, timedelta
 from dateutil.rrule import rrule, MONTHLY, YEARLY
 from astral import LocationInfo
 from astral.sun import sun
@@ -22,18 +21,33 @@ class RecurringSunEventGenerator:
         self.location = LocationInfo("Auckland", "NZ", timezone, -36.8440526109716, 174.7675260738167)
         self.events = []
 
+        # 连续按日期排列的太阳时间数组，下标 i 对应 _base_date + i 天，
+        # 初始覆盖 start_year 1月1日 到 end_year+1 1月1日（含），按需填充
+        self._base_date = date(start_year, 1, 1)
+        days = (date(end_year + 1, 1, 1) - self._base_date).days + 1
+        self._sun_days = [None] * days
+
+    def _sun_index(self, d):
+        """返回某日在太阳时间数组中的下标，并在需要时计算该日数据"""
+        i = (d - self._base_date).days
+        # 超出范围时向两端扩展，保持数组连续
+        if i < 0:
+            self._sun_days[:0] = [None] * -i
+            self._base_date = d
+            i = 0
+        elif i >= len(self._sun_days):
+            self._sun_days.extend([None] * (i - len(self._sun_days) + 1))
+        if self._sun_days[i] is None:
+            self._sun_days[i] = sun(self.location.observer, date=d, tzinfo=self.timezone)
+        return i
+
     def _get_sun_times(self, dt):
         """返回包含时间差的双格式数据"""
-        days = 1
-        next_day = dt + relativedelta(days=days)
-        
-        # 月末处理逻辑
-        if next_day.month != dt.month:
-            next_day = next_day.replace(day=1) + relativedelta(days=days-1)
-        
-        # 获取太阳时间数据
-        s = sun(self.location.observer, date=dt.date(), tzinfo=self.timezone)
-        s2 = sun(self.location.observer, date=next_day.date(), tzinfo=self.timezone)
+        # 获取太阳时间数据，次日日出即数组中的下一个元素
+        i = self._sun_index(dt.date())
+        self._sun_index(dt.date() + timedelta(days=1))
+        s = self._sun_days[i]
+        s2 = self._sun_days[i + 1]
         
         def format_diff(start, end):
             """时间差格式化函数"""
@@ -1,11 +1,11 @@
 from ics import Calendar, Event, DisplayAlarm
 from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
 from dateutil.rrule import rrule, MONTHLY, YEARLY
 from astral import LocationInfo
 from astral.sun import sun
 import pytz
 import calendar
+import bisect
 from skyfield import api
 from skyfield import almanac
 import ssl
@@ -32,19 +32,59 @@ class RecurringSunEventGenerator:
         self.eph = api.load(file_path)
         #self.eph = api.load('de421.bsp')
         self.location = api.Topos(latitude_degrees=self.lat, longitude_degrees=self.lon)
+        # 按时间排序的日出、日落时间（本地时区），覆盖当地日期 [_sun_first_day, _sun_last_day]
+        # 首次使用时计算 start_year 到 end_year+1 年初，超出范围时只向需要的一端扩展
+        self._sunrises = []
+        self._sunsets = []
+        self._sun_first_day = None
+        self._sun_last_day = None
+
+    def _local_midnight(self, day):
+        """当地日期 day 的零点"""
+        return self.timezone.localize(datetime(day.year, day.month, day.day))
+
+    def _find_sun_events(self, first_day, last_day):
+        """一次 find_discrete 计算当地日期 [first_day, last_day] 内所有日出和日落"""
+        t0 = self.ts.from_datetime(self._local_midnight(first_day))
+        t1 = self.ts.from_datetime(self._local_midnight(last_day + timedelta(days=1)))
+
+        f = almanac.sunrise_sunset(self.eph, self.location)
+        times, events = almanac.find_discrete(t0, t1, f)
+        sunrises = list(times[events == 1].astimezone(self.timezone))
+        sunsets = list(times[events == 0].astimezone(self.timezone))
+        return sunrises, sunsets
+
+    def _ensure_sun_events(self, day):
+        """确保 day 及其次日在已加载的日出日落数组范围内"""
+        if self._sun_first_day is None:
+            self._sun_first_day = datetime(self.start_year, 1, 1).date()
+            self._sun_last_day = datetime(self.end_year + 1, 1, 1).date()
+            self._sunrises, self._sunsets = self._find_sun_events(
+                self._sun_first_day, self._sun_last_day)
+
+        if day < self._sun_first_day:
+            sunrises, sunsets = self._find_sun_events(
+                day, self._sun_first_day - timedelta(days=1))
+            self._sunrises[:0] = sunrises
+            self._sunsets[:0] = sunsets
+            self._sun_first_day = day
+
+        next_day = day + timedelta(days=1)
+        if next_day > self._sun_last_day:
+            sunrises, sunsets = self._find_sun_events(
+                self._sun_last_day + timedelta(days=1), next_day)
+            self._sunrises.extend(sunrises)
+            self._sunsets.extend(sunsets)
+            self._sun_last_day = next_day
 
     def _get_sun_times(self, dt):
         """返回包含时间差的双格式数据"""
-        days = 1
-        next_day = dt + relativedelta(days=days)
-        
-        # 月末处理逻辑
-        if next_day.month != dt.month:
-            next_day = next_day.replace(day=1) + relativedelta(days=days-1)
-        
-        # 获取太阳时间数据 - 使用 skyfield 替代 astral
-        current_day_times = self._calculate_sun_times(dt)
-        next_day_times = self._calculate_sun_times(next_day)
+        # 日出日落取自连续排序的数组，按当地零点二分查找，次日日出即下一个元素
+        day = dt.date()
+        self._ensure_sun_events(day)
+        midnight = self._local_midnight(day)
+        i = bisect.bisect_left(self._sunrises, midnight)
+        j = bisect.bisect_left(self._sunsets, midnight)
         
         def format_diff(start, end):
             """时间差格式化函数"""
@@ -80,49 +120,26 @@ class RecurringSunEventGenerator:
                 "date_time": t
             }
         
-        sunrise_time = current_day_times["sunrise"]
-        next_sunrise_time = next_day_times["sunrise"]
+        sunrise_time = self._sunrises[i]
+        next_sunrise_time = self._sunrises[i + 1]
         
         return {
             "sunrise": format_time(sunrise_time),
-            "noon": format_time(current_day_times["noon"]),
-            "sunset": format_time(current_day_times["sunset"]),
+            "noon": format_time(self._calculate_noon(day)),
+            "sunset": format_time(self._sunsets[j]),
             "next_sunrise": format_time(next_sunrise_time),
             "sunrise_diff": format_diff(sunrise_time, next_sunrise_time)
         }
 
+    def _calculate_noon(self, day):
+        """使用skyfield计算当地日期 day 的太阳正午时间（最高点）"""
+        # 搜索窗口为当地零点到次日当地零点
+        t0_time = self._local_midnight(day).astimezone(pytz.UTC)
+        t1_time = self._local_midnight(day + timedelta(days=1)).astimezone(pytz.UTC)
         
-    def _calculate_sun_times(self, dt):
-        """使用skyfield计算日出、正午和日落时间"""
-        # 转换为UTC日期，午夜开始
-        midnight = datetime(dt.year, dt.month, dt.day, tzinfo=pytz.UTC)
-        t0 = self.ts.from_datetime(midnight)
-        t1 = self.ts.from_datetime(midnight + timedelta(days=1))
-        
-        # 寻找日出日落事件
         earth = self.eph['earth']
         sun = self.eph['sun']
         
-        f = almanac.sunrise_sunset(self.eph, self.location)
-        times, events = almanac.find_discrete(t0, t1, f)
-        
-        # 初始化结果
-        result = {"sunrise": None, "sunset": None, "noon": None}
-        
-        # 解析日出日落时间
-        for time, is_sunrise in zip(times, events):
-            # 将Skyfield时间转换为datetime对象
-            dt_local = time.astimezone(self.timezone)
-            
-            if is_sunrise:
-                result["sunrise"] = dt_local
-            else:
-                result["sunset"] = dt_local
-        
-        # 计算太阳正午时间（最高点）
-        t0_time = t0.utc_datetime()
-        t1_time = t1.utc_datetime()
-        
         # 以15分钟为间隔搜索太阳高度
         highest_altitude = -90
         noon_time = None
@@ -143,31 +160,25 @@ class RecurringSunEventGenerator:
             current_time += timedelta(minutes=15)
         
         # 精确化搜索，1分钟为间隔在最高点附近搜索
-        if noon_time:
-            refined_start = noon_time - timedelta(minutes=30)
-            refined_end = noon_time + timedelta(minutes=30)
+        refined_start = noon_time - timedelta(minutes=30)
+        refined_end = noon_time + timedelta(minutes=30)
+        
+        current_time = refined_start
+        while current_time < refined_end:
+            t = self.ts.from_datetime(current_time)
             
-            current_time = refined_start
-            while current_time < refined_end:
-                t = self.ts.from_datetime(current_time)
-                
-                astrometric = (earth + self.location).at(t).observe(sun)
-                apparent = astrometric.apparent()
-                alt, az, distance = apparent.altaz()
-                
-                if alt.degrees > highest_altitude:
-                    highest_altitude = alt.degrees
-                    noon_time = current_time
-                
-                current_time += timedelta(minutes=1)
+            astrometric = (earth + self.location).at(t).observe(sun)
+            apparent = astrometric.apparent()
+            alt, az, distance = apparent.altaz()
+            
+            if alt.degrees > highest_altitude:
+                highest_altitude = alt.degrees
+                noon_time = current_time
             
-            # 转换为本地时间
-            if noon_time:
-                t_noon = self.ts.from_datetime(noon_time)
-                # 调用datetime()将Time对象转换为标准datetime对象
-                result["noon"] = t_noon.astimezone(self.timezone)
+            current_time += timedelta(minutes=1)
         
-        return result
+        # 转换为本地时间
+        return self.ts.from_datetime(noon_time).astimezone(self.timezone)
             
     def _add_event(self, dt: datetime):
         sun_times = self._get_sun_times(dt)